@@ -1,27 +1,26 @@
 from openai import OpenAI
 import httpx
-from PIL import Image
 import base64
-import io
 import re
 import json
 from xml.etree import ElementTree as ET
-from config import OPENAI_API_KEY, MAX_IMAGE_SIZE
+from config import OPENAI_API_KEY, MAX_IMAGE_SIZE, THUMBNAIL_CACHE_DIR
+from thumbnail_cache import ThumbnailCache, prepare_thumbnail
 
 class AIAnalyzer:
     def __init__(self):
         self.client = OpenAI(api_key=OPENAI_API_KEY, http_client=httpx.Client())
+        # Prepared thumbnails are reused across runs so prompt/model changes skip the decode
+        self.thumbnail_cache = ThumbnailCache() if THUMBNAIL_CACHE_DIR else None
         
     def analyze_image(self, image_path, existing_metadata=None):
         try:
-            # Open and resize image
-            with Image.open(image_path) as img:
-                img.thumbnail(MAX_IMAGE_SIZE)
-                
-                # Convert to base64
-                buffered = io.BytesIO()
-                img.save(buffered, format="PNG")
-                img_base64 = base64.b64encode(buffered.getvalue()).decode('utf-8')
+            # Resized, PNG-encoded image (from the thumbnail cache when enabled)
+            if self.thumbnail_cache is not None:
+                thumbnail_bytes = self.thumbnail_cache.get_or_prepare(image_path)
+            else:
+                thumbnail_bytes = prepare_thumbnail(image_path, MAX_IMAGE_SIZE)
+            img_base64 = base64.b64encode(thumbnail_bytes).decode('utf-8')
             
             # Build prompt with existing metadata context
             context = ""
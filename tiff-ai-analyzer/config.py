@@ -6,3 +6,11 @@ load_dotenv()
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 SUPPORTED_FORMATS = ['.tiff', '.tif']
 MAX_IMAGE_SIZE = (1024, 1024)  # Resize for AI analysis
+
+# Prepared-thumbnail cache (set THUMBNAIL_CACHE_DIR to an empty string to disable)
+THUMBNAIL_CACHE_DIR = os.getenv(
+    'THUMBNAIL_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'tiff-ai-analyzer', 'thumbnails')
+)
+THUMBNAIL_CACHE_MAX_MB = int(os.getenv('THUMBNAIL_CACHE_MAX_MB', '2048'))
+THUMBNAIL_CACHE_HASH_CONTENT = os.getenv('THUMBNAIL_CACHE_HASH_CONTENT', '').lower() in ('1', 'true', 'yes')
@@ -0,0 +1,58 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from thumbnail_cache import ThumbnailCache, prepare_thumbnail
+from config import SUPPORTED_FORMATS, THUMBNAIL_CACHE_DIR
+
+def _collect_files(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, _, filenames in os.walk(path):
+                for name in sorted(filenames):
+                    if any(name.lower().endswith(ext) for ext in SUPPORTED_FORMATS):
+                        files.append(os.path.join(dirpath, name))
+        elif any(path.lower().endswith(ext) for ext in SUPPORTED_FORMATS) and os.path.exists(path):
+            files.append(path)
+        else:
+            print(f"Skipping unsupported or missing path: {path}")
+    return files
+
+def _prewarm_one(image_path):
+    # Eviction is done once by the parent so workers don't fight over it
+    cache = ThumbnailCache(max_bytes=0)
+    if cache.get(image_path) is not None:
+        return False
+    cache.put(image_path, prepare_thumbnail(image_path, cache.size, cache.image_format))
+    return True
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python prewarm_cache.py <tiff_file_or_directory> [...]")
+        sys.exit(1)
+
+    if not THUMBNAIL_CACHE_DIR:
+        print("Thumbnail cache is disabled (THUMBNAIL_CACHE_DIR is empty).")
+        sys.exit(1)
+
+    files = _collect_files(sys.argv[1:])
+    print(f"Pre-warming thumbnail cache for {len(files)} file(s) in {THUMBNAIL_CACHE_DIR}")
+
+    prepared = cached = failed = 0
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {executor.submit(_prewarm_one, f): f for f in files}
+        for future in as_completed(futures):
+            try:
+                if future.result():
+                    prepared += 1
+                else:
+                    cached += 1
+            except Exception as e:
+                failed += 1
+                print(f"Error preparing {futures[future]}: {e}")
+
+    ThumbnailCache().prune()
+    print(f"Pre-warm complete: {prepared} prepared, {cached} already cached, {failed} failed.")
+
+if __name__ == "__main__":
+    main()
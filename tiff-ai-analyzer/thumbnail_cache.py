@@ -0,0 +1,162 @@
+from PIL import Image
+import hashlib
+import io
+import json
+import os
+import tempfile
+from config import (
+    MAX_IMAGE_SIZE,
+    THUMBNAIL_CACHE_DIR,
+    THUMBNAIL_CACHE_MAX_MB,
+    THUMBNAIL_CACHE_HASH_CONTENT,
+)
+
+# Bump when the way thumbnails are produced changes, so stale entries are ignored
+CACHE_VERSION = 1
+IMAGE_FORMAT = "PNG"
+
+
+def prepare_thumbnail(image_path, size=MAX_IMAGE_SIZE, image_format=IMAGE_FORMAT):
+    """Decodes the image, shrinks it to fit `size` and returns the encoded bytes."""
+    with Image.open(image_path) as img:
+        img.thumbnail(size)
+        buffered = io.BytesIO()
+        img.save(buffered, format=image_format)
+        return buffered.getvalue()
+
+
+class ThumbnailCache:
+    """On-disk cache of prepared thumbnails, independent of prompt/model.
+
+    Entries are keyed by source path, size, mtime (and optionally a content
+    hash) plus the target size and encoding settings. The total size of the
+    cache is capped; least recently used entries are evicted first.
+    """
+
+    def __init__(self, cache_dir=THUMBNAIL_CACHE_DIR, max_bytes=THUMBNAIL_CACHE_MAX_MB * 1024 * 1024,
+                 hash_content=THUMBNAIL_CACHE_HASH_CONTENT, size=MAX_IMAGE_SIZE, image_format=IMAGE_FORMAT):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hash_content = hash_content
+        self.size = tuple(size)
+        self.image_format = image_format
+        self._total_bytes = None
+
+    def _content_hash(self, image_path):
+        h = hashlib.sha256()
+        with open(image_path, 'rb') as fh:
+            for chunk in iter(lambda: fh.read(1024 * 1024), b''):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def cache_key(self, image_path):
+        st = os.stat(image_path)
+        key = {
+            'version': CACHE_VERSION,
+            'path': os.path.abspath(image_path),
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'target_size': list(self.size),
+            'format': self.image_format,
+        }
+        if self.hash_content:
+            key['sha256'] = self._content_hash(image_path)
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.{self.image_format.lower()}")
+
+    def get(self, image_path):
+        """Returns cached thumbnail bytes for `image_path`, or None on a miss."""
+        path = self._entry_path(self.cache_key(image_path))
+        try:
+            with open(path, 'rb') as fh:
+                data = fh.read()
+        except FileNotFoundError:
+            return None
+        # Refresh mtime so eviction treats this entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(self, image_path, data):
+        path = self._entry_path(self.cache_key(image_path))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temp file and rename so readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                fh.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        if not self.max_bytes:
+            return
+        if self._total_bytes is None:
+            self._total_bytes = self._scan_total()
+        else:
+            self._total_bytes += len(data)
+        if self._total_bytes > self.max_bytes:
+            self.prune()
+
+    def get_or_prepare(self, image_path):
+        """Returns encoded thumbnail bytes, preparing and storing them on a miss.
+
+        Cache I/O errors never fail the caller; the thumbnail is prepared directly instead.
+        """
+        try:
+            data = self.get(image_path)
+            if data is not None:
+                return data
+        except Exception as e:
+            print(f"Thumbnail cache read failed for {image_path}: {e}")
+
+        data = prepare_thumbnail(image_path, self.size, self.image_format)
+        try:
+            self.put(image_path, data)
+        except Exception as e:
+            print(f"Thumbnail cache write failed for {image_path}: {e}")
+        return data
+
+    def _entries(self):
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for dirpath, _, filenames in os.walk(self.cache_dir):
+            for name in filenames:
+                if name.endswith('.tmp'):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def _scan_total(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def prune(self):
+        """Evicts least recently used entries until the cache is under 90% of its cap."""
+        if not self.max_bytes:
+            return
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._total_bytes = total